@@ -4,12 +4,11 @@ import abc
 import asyncio
 import enum
 from collections.abc import Awaitable, Callable, Container
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypedDict, cast, overload
-from xml.sax.saxutils import escape as xml_escape
-from xml.sax.saxutils import quoteattr as xml_quoteattr
 
-from .io import open_file
+from .io import load_text_file
 from .typing import (
     AsyncFunctionComponent,
     Component,
@@ -168,8 +167,7 @@ class Snippet:
         if isinstance(path_or_text, Text):
             return path_or_text
         else:
-            async with await open_file(path_or_text, "r") as f:
-                return await f.read()
+            return await load_text_file(path_or_text)
 
     def _render_text(self, text: str, context: Context) -> Component:
         """
@@ -390,7 +388,37 @@ class XBool(enum.Enum):
 
 def xml_format_string(value: str) -> str:
     """Escapes `<`, `>`, and `&` characters in the given string, unless it's a `SafeStr`."""
-    return value if isinstance(value, SafeStr) else xml_escape(value)
+    # Equivalent to xml.sax.saxutils.escape(), but without its function call and entity
+    # mapping overhead. Chained str.replace() calls are faster than str.translate() here.
+    # Most strings need no escaping at all, and the `in` checks are much cheaper than replace().
+    if isinstance(value, SafeStr) or not ("&" in value or "<" in value or ">" in value):
+        return value
+
+    return value.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+
+
+def _xml_quote_attribute(value: str) -> str:
+    """
+    Escapes and quotes the given attribute value.
+
+    Equivalent to `xml.sax.saxutils.quoteattr()`, but importing `xml.sax.saxutils` is slow
+    (it imports `urllib.request`) and its implementation has significant call overhead.
+    """
+    value = (
+        value.replace("&", "&amp;")
+        .replace(">", "&gt;")
+        .replace("<", "&lt;")
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+        .replace("\t", "&#9;")
+    )
+    if '"' not in value:
+        return f'"{value}"'
+
+    if "'" not in value:
+        return f"'{value}'"
+
+    return '"{}"'.format(value.replace('"', "&quot;"))
 
 
 class Formatter(ContextAware):
@@ -444,7 +472,7 @@ class Formatter(ContextAware):
         See `SkipProperty` for more information.
         """
         try:
-            return f"{self.format_name(name)}={xml_quoteattr(self.format_value(value))}"
+            return f"{self.format_name(name)}={_xml_quote_attribute(self.format_value(value))}"
         except SkipProperty:
             return ""
 
@@ -493,6 +521,18 @@ class Formatter(ContextAware):
 _default_tag_formatter = Formatter()
 
 
+@lru_cache(1024)
+def _opening_tag(name: str) -> SafeStr:
+    """Returns the opening tag for the given tag name, for tags with no properties."""
+    return SafeStr(f"<{name}>")
+
+
+@lru_cache(1024)
+def _closing_tag(name: str) -> SafeStr:
+    """Returns the closing tag for the given tag name."""
+    return SafeStr(f"</{name}>")
+
+
 class TagConfig(TypedDict, total=False):
     """Tag configuration."""
 
@@ -548,13 +588,14 @@ class TagWithProps(BaseTag):
     def htmy(self, context: Context) -> Component:
         """Renders the component."""
         name = self.htmy_name
-        props = self._htmy_format_props(context=context)
-        return SafeStr(f"<{name} {props}/>")
+        return SafeStr(
+            f"<{name} {self._htmy_format_props(context=context)}/>" if self.props else f"<{name}/>"
+        )
 
     def _htmy_format_props(self, context: Context) -> str:
         """Formats tag properties."""
         formatter = Formatter.from_context(context, _default_tag_formatter)
-        return " ".join(formatter.format(name, value) for name, value in self.props.items())
+        return " ".join([formatter.format(name, value) for name, value in self.props.items()])
 
 
 class Tag(TagWithProps):
@@ -583,8 +624,12 @@ class Tag(TagWithProps):
     def htmy(self, context: Context) -> Component:
         """Renders the component."""
         name = self.htmy_name
-        props = self._htmy_format_props(context=context)
-        opening, closing = SafeStr(f"<{name} {props}>"), SafeStr(f"</{name}>")
+        opening = (
+            SafeStr(f"<{name} {self._htmy_format_props(context=context)}>")
+            if self.props
+            else _opening_tag(name)
+        )
+        closing = _closing_tag(name)
         separator = self.child_separator
         return (
             opening,
@@ -3,14 +3,132 @@ from __future__ import annotations
 from .core import SafeStr, Tag, TagConfig, TagWithProps
 from .typing import PropertyValue
 
+__all__ = (
+    "DOCTYPE",
+    "html",
+    "head",
+    "body",
+    "base",
+    "title",
+    "link",
+    "meta",
+    "script",
+    "style",
+    "dialog",
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "div",
+    "embed",
+    "figure",
+    "figcaption",
+    "footer",
+    "header",
+    "hgroup",
+    "hr",
+    "iframe",
+    "main",
+    "details",
+    "summary",
+    "nav",
+    "menu",
+    "noscript",
+    "pre",
+    "section",
+    "template",
+    "form",
+    "search",
+    "button",
+    "option",
+    "optgroup",
+    "datalist",
+    "fieldset",
+    "input_",
+    "label",
+    "legend",
+    "meter",
+    "object",
+    "output",
+    "progress",
+    "select",
+    "textarea",
+    "a",
+    "abbr",
+    "b",
+    "bdi",
+    "bdo",
+    "br",
+    "cite",
+    "code",
+    "data",
+    "del_",
+    "dfn",
+    "em",
+    "i",
+    "picture",
+    "img",
+    "source",
+    "ins",
+    "mark",
+    "q",
+    "s",
+    "samp",
+    "small",
+    "span",
+    "strong",
+    "sub",
+    "sup",
+    "svg",
+    "u",
+    "var",
+    "wbr",
+    "li",
+    "ol",
+    "ul",
+    "dl",
+    "dt",
+    "dd",
+    "caption",
+    "table",
+    "thead",
+    "tbody",
+    "tfoot",
+    "tr",
+    "th",
+    "td",
+    "colgroup",
+    "col",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "p",
+    "time",
+    "audio",
+    "video",
+    "track",
+    "canvas",
+    "area",
+    "map",
+    "slot",
+    "entity",
+)
+
 
 class _DefaultTagConfig:
+    __slots__ = ()
+
     inline_children: TagConfig = {"child_separator": None}
 
 
 class DOCTYPE:
     """Document type declaration."""
 
+    __slots__ = ()
+
     html = SafeStr("<!DOCTYPE html>")
     """HTML document type."""
 
@@ -1240,6 +1358,8 @@ class slot(Tag):
 
 
 class entity:
+    __slots__ = ()
+
     amp = SafeStr("&amp;")
     apos = SafeStr("&apos;")
     cent = SafeStr("&cent;")
@@ -1,12 +1,18 @@
-import json
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar, overload
 
+from anyio import create_task_group, to_thread
 from async_lru import alru_cache
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 from .core import ContextAware
-from .io import open_file
+from .io import load_binary_file
 
 TranslationResource = Mapping[str, Any]
 """Translation resource type."""
@@ -39,8 +45,8 @@ class I18n(ContextAware):
             path: Path to the root directory that contains the translation resources.
             fallback: Optional fallback path to use if `path` doesn't contain the required resources.
         """
-        self._path: Path = Path(path) if isinstance(path, str) else path
-        self._fallback: Path | None = Path(fallback) if isinstance(fallback, str) else fallback
+        self._path: Path = _path_of(path) if isinstance(path, str) else path
+        self._fallback: Path | None = _path_of(fallback) if isinstance(fallback, str) else fallback
 
     @overload
     async def get(self, dotted_path: str, key: str) -> Any: ...
@@ -76,6 +82,37 @@ class I18n(ContextAware):
 
             return await self._resolve(self._fallback, dotted_path, key, **kwargs)
 
+    async def preload(self) -> None:
+        """
+        Loads all translation resources from `path` and `fallback` (if set).
+
+        Calling this method is optional. It can be used for example on application startup
+        to make sure subsequent `get()` calls never need to load anything from the file system
+        (as long as all the resources fit in the cache of `load_translation_resource()`).
+
+        Raises:
+            I18nValueError: If one of the translation resources is invalid.
+        """
+        errors: list[I18nValueError] = []
+
+        async def load(path: Path) -> None:
+            try:
+                await load_translation_resource(path)
+            except I18nValueError as e:
+                # Raising here would wrap the error in an ExceptionGroup.
+                errors.append(e)
+                tg.cancel_scope.cancel()
+
+        roots = (self._path,) if self._fallback is None else (self._path, self._fallback)
+        # Walking the directory tree is blocking, it must not run on the event loop.
+        paths = await to_thread.run_sync(_find_translation_resources, roots)
+        async with create_task_group() as tg:
+            for path in paths:
+                tg.start_soon(load, path)
+
+        if errors:
+            raise errors[0]
+
     @classmethod
     async def _resolve(cls, root: Path, dotted_subpath: str, key: str, **kwargs: Any) -> Any:
         """
@@ -97,11 +134,11 @@ class I18n(ContextAware):
         if key in cls._root_keys:
             return result
 
-        for k in key.split("."):
-            try:
+        try:
+            for k in _split_key(key):
                 result = result[k]
-            except KeyError as e:
-                raise I18nKeyError(f"Key not found: {key}") from e
+        except KeyError as e:
+            raise I18nKeyError(f"Key not found: {key}") from e
 
         if len(kwargs) > 0:
             if not isinstance(result, str):
@@ -112,11 +149,15 @@ class I18n(ContextAware):
         return result
 
 
-@alru_cache(8)
+@alru_cache(256)
 async def load_translation_resource(path: Path) -> TranslationResource:
     """
     Loads the translation resource from the given path.
 
+    Successfully loaded resources are cached (up to 256 files). Call
+    `load_translation_resource.cache_clear()` to reload resources, for example
+    after they changed on disk.
+
     Arguments:
         path: The path of the translation resource to load.
 
@@ -128,14 +169,13 @@ async def load_translation_resource(path: Path) -> TranslationResource:
     """
 
     try:
-        async with await open_file(path, "r") as f:
-            content = await f.read()
+        content = await load_binary_file(path)
     except FileNotFoundError as e:
         raise I18nValueError(f"Translation resource not found: {str(path)}") from e
 
     try:
-        result = json.loads(content)
-    except json.JSONDecodeError as e:
+        result = json_loads(content)
+    except ValueError as e:  # JSON and unicode decoding errors.
         raise I18nValueError("Translation resource decoding failed.") from e
 
     if isinstance(result, dict):
@@ -144,10 +184,40 @@ async def load_translation_resource(path: Path) -> TranslationResource:
     raise I18nValueError("Only dict translation resources are allowed.")
 
 
+def _find_translation_resources(roots: tuple[Path, ...]) -> set[Path]:
+    """
+    Returns the paths of all the translation resources in the given root directories.
+
+    The result contains every path only once, even if the root directories overlap.
+    Paths are not resolved, so they match the paths `get()` loads resources from.
+    """
+    return {path for root in roots for path in root.rglob("*.json")}
+
+
+@lru_cache(512)
+def _path_of(path: str) -> Path:
+    """
+    Returns the `Path` for the given string.
+
+    Reusing `Path` instances also makes `resolve_json_path()` cache lookups cheaper,
+    because `Path` caches its hash.
+    """
+    return Path(path)
+
+
+@lru_cache(4096)
+def _split_key(key: str) -> tuple[str, ...]:
+    """Splits the given dotted translation resource key into its parts."""
+    return tuple(key.split("."))
+
+
+@lru_cache(1024)
 def resolve_json_path(root: Path, dotted_subpath: str) -> Path:
     """
     Resolves the given dotted subpath relative to root.
 
+    Results are cached. Errors are not cached, so invalid paths raise every time.
+
     Arguments:
         root: The root path.
         dotted_subpath: Subpath under `root` with dots as separators.
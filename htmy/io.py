@@ -1 +1,19 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from anyio import Path as AsyncPath
 from anyio import open_file as open_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+async def load_text_file(path: str | Path) -> str:
+    """Loads the text content from the given file."""
+    return await AsyncPath(path).read_text()
+
+
+async def load_binary_file(path: str | Path) -> bytes:
+    """Loads the binary content from the given file."""
+    return await AsyncPath(path).read_bytes()
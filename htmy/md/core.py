@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from functools import lru_cache
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING
 
 from markdown import Markdown
 
@@ -13,7 +15,7 @@ if TYPE_CHECKING:
 
     from htmy.typing import Component, Context
 
-    from .typing import MarkdownParserFunction, MarkdownRenderFunction, ParsedMarkdown
+    from .typing import MarkdownMetadataDict, MarkdownParserFunction, MarkdownRenderFunction, ParsedMarkdown
 
 
 class MarkdownParser(ContextAware):
@@ -22,22 +24,20 @@ class MarkdownParser(ContextAware):
 
     By default, this class uses the `markdown` library with a sensible set of
     [extensions](https://python-markdown.github.io/extensions/) including code highlighing.
+
+    The parser function can be replaced (for example with a faster, non-pure-Python markdown
+    library) by creating an instance with a custom `md` function and adding it to the
+    rendering context.
     """
 
     __slots__ = ("_md",)
 
-    _default: ClassVar[MarkdownParser | None] = None
-    """The default instance or `None` if one hasn't been created already."""
-
     @classmethod
     def default(cls) -> MarkdownParser:
         """
         Returns the default instance.
         """
-        if cls._default is None:
-            cls._default = MarkdownParser()
-
-        return cls._default
+        return _default_parser
 
     def __init__(self, md: MarkdownParserFunction | None = None) -> None:
         """
@@ -52,6 +52,9 @@ class MarkdownParser(ContextAware):
     def parse(self, text: str) -> ParsedMarkdown:
         """
         Returns the markdown data by parsing the given text.
+
+        The default parser function caches its results, but it returns a copy of the cached
+        data on every call, so the returned object can be mutated safely.
         """
         md = self._md
         if md is None:
@@ -64,18 +67,51 @@ class MarkdownParser(ContextAware):
         """
         Function that creates the default markdown parser.
 
+        Parsing is deterministic, so the parser function caches its results. The cached
+        `ParsedMarkdown` objects are never exposed, every call returns a copy of them.
+
+        `Markdown` instances are not thread-safe and they are expensive to create, so the
+        parser function keeps a pool of them and only creates a new one if all existing
+        instances are in use.
+
         Returns:
             The default parser function.
         """
-        md = Markdown(extensions=("extra", "meta", "codehilite"))
+        pool: SimpleQueue[Markdown] = SimpleQueue()
+        pool.put(self._create_markdown())
+
+        @lru_cache(maxsize=256)
+        def parse_cached(text: str) -> ParsedMarkdown:
+            try:
+                md = pool.get_nowait()
+            except Empty:
+                md = self._create_markdown()
+
+            try:
+                md.reset()
+                parsed = md.convert(text)
+                return {"content": parsed, "metadata": getattr(md, "Meta", None)}
+            finally:
+                pool.put(md)
 
         def parse(text: str) -> ParsedMarkdown:
-            md.reset()
-            parsed = md.convert(text)
-            return {"content": parsed, "metadata": getattr(md, "Meta", None)}
+            parsed = parse_cached(text)
+            metadata = parsed.get("metadata", None)
+            return {
+                "content": parsed["content"],
+                "metadata": None if metadata is None else _copy_metadata(metadata),
+            }
 
         return parse
 
+    def _create_markdown(self) -> Markdown:
+        """Creates a new `Markdown` instance for the default parser."""
+        return Markdown(extensions=("extra", "meta", "codehilite"))
+
+
+_default_parser = MarkdownParser()
+"""The default markdown parser instance."""
+
 
 class MD(Snippet):
     """Component for reading, customizing, and rendering markdown documents."""
@@ -111,6 +147,15 @@ class MD(Snippet):
         self._renderer = renderer
 
     def _render_text(self, text: str, context: Context) -> Component:
-        md = MarkdownParser.from_context(context, MarkdownParser.default()).parse(text)
+        md = MarkdownParser.from_context(context, _default_parser).parse(text)
         result = self._converter(md["content"])
         return result if self._renderer is None else self._renderer(result, md.get("metadata", None))
+
+
+def _copy_metadata(metadata: MarkdownMetadataDict) -> MarkdownMetadataDict:
+    """
+    Returns a copy of the given markdown metadata that can be mutated without affecting the original.
+
+    Metadata values are lists of strings, so copying the lists is sufficient.
+    """
+    return {key: list(value) if isinstance(value, list) else value for key, value in metadata.items()}
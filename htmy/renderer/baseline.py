@@ -5,7 +5,7 @@ from collections import ChainMap
 from collections.abc import Awaitable, Callable, Iterable
 
 from htmy.core import ErrorBoundary, xml_format_string
-from htmy.typing import Component, ComponentType, Context
+from htmy.typing import Component, ComponentType, Context, is_component_sequence
 
 
 class Renderer:
@@ -72,8 +72,13 @@ class Renderer:
         if isinstance(component, str):
             return self._string_formatter(component)
         elif isinstance(component, Iterable):
+            children = component if is_component_sequence(component) else tuple(component)
+            if len(children) == 1:
+                # No need for the overhead of creating a task and gathering a single result.
+                return await self._render_one(children[0], context)
+
             rendered_children = await asyncio.gather(
-                *(self._render_one(comp, context) for comp in component)
+                *(self._render_one(comp, context) for comp in children)
             )
 
             return "".join(rendered_children)
@@ -1,60 +1,121 @@
 from __future__ import annotations
 
 import asyncio
-from collections import ChainMap, deque
-from collections.abc import Awaitable, Callable, Iterator
-from typing import TypeAlias
+from collections import ChainMap
+from collections.abc import Callable
+from typing import Any, TypeAlias
+from weakref import WeakKeyDictionary
 
 from htmy.core import ErrorBoundary, xml_format_string
-from htmy.typing import Component, ComponentType, Context, ContextProvider, is_component_sequence
+from htmy.typing import (
+    Component,
+    Context,
+    ContextProvider,
+    HTMYComponentType,
+    is_component_sequence,
+)
 
+_Parts: TypeAlias = list[Any]
+"""
+List of component parts.
 
-class _Node:
-    """A single node in the linked list the renderer constructs to resolve a component tree."""
+Items are either resolved strings, `HTMYComponentType`s that still need to be resolved, or nested
+`_Parts` lists (the resolved children of a component).
+"""
 
-    __slots__ = ("component", "next")
+_Todo: TypeAlias = tuple[HTMYComponentType, _Parts, int, Context]
+"""Component, the parts list that contains it, its index in the parts list, and its child context."""
 
-    def __init__(self, component: ComponentType, next: _Node | None = None) -> None:
-        """
-        Initialization.
+_async_component_types: WeakKeyDictionary[type, bool] = WeakKeyDictionary()
+"""Cache that stores whether the `htmy()` method of a given component type is async."""
 
-        Arguments:
-            component: The component in this node.
-            next: The next component in the list, if there is one.
-        """
-        self.component = component
-        self.next = next
+_async_context_provider_types: WeakKeyDictionary[type, bool] = WeakKeyDictionary()
+"""Cache that stores whether the `htmy_context()` method of a given context provider type is async."""
 
-    def iter_nodes(self, *, include_self: bool = True) -> Iterator[_Node]:
-        """
-        Iterates over all following nodes.
 
-        Arguments:
-            include_self: Whether the node on which this method is called should also
-                be included in the iterator.
-        """
-        current = self if include_self else self.next
-        while current is not None:
-            yield current
-            current = current.next
+_max_merged_context_size = 32
+"""
+The maximum total size of two contexts that are merged into a new `dict`. Larger contexts are
+combined with a `ChainMap` to avoid the copy cost.
+"""
+
+
+def _merge_contexts(context: Context, extra_context: Context) -> Context:
+    """
+    Returns a new context that contains the items of both `context` and `extra_context`,
+    with `extra_context` taking precedence.
+
+    Small `dict` contexts are merged into a new `dict`, so lookups don't have to walk a chain of
+    mappings whose length grows with the depth of the context provider nesting. If `context` is an
+    empty `dict`, `extra_context` is returned as is. Contexts must not be mutated, so the result is
+    equivalent to a `ChainMap` in every other respect.
+
+    Arguments:
+        context: The base context.
+        extra_context: The context whose items take precedence.
+    """
+    if type(context) is dict:
+        if not context:
+            return extra_context
+
+        if len(context) + len(extra_context) < _max_merged_context_size:
+            return {**context, **extra_context}
 
+    # Context must not be mutated. We can ignore that ChainMap expects mutable mappings.
+    return ChainMap(extra_context, context)  # type: ignore[arg-type]
 
-_NodeAndChildContext: TypeAlias = tuple[_Node, Context]
+
+def _is_async_component(component: HTMYComponentType) -> bool:
+    """
+    Returns whether the `htmy()` method of the given component is async.
+
+    `iscoroutinefunction()` is expensive, so the result is cached by component type.
+    """
+    component_type = type(component)
+    try:
+        return _async_component_types[component_type]
+    except KeyError:
+        result = asyncio.iscoroutinefunction(component.htmy)
+        _async_component_types[component_type] = result
+        return result
+
+
+def _is_async_context_provider(component: ContextProvider) -> bool:
+    """
+    Returns whether the `htmy_context()` method of the given context provider is async.
+
+    `iscoroutinefunction()` is expensive, so the result is cached by component type.
+    """
+    component_type = type(component)
+    try:
+        return _async_context_provider_types[component_type]
+    except KeyError:
+        result = asyncio.iscoroutinefunction(component.htmy_context)
+        _async_context_provider_types[component_type] = result
+        return result
 
 
 class _ComponentRenderer:
     """
-    `ComponentType` renderer that converts a component tree into a linked list of resolved (`str`) nodes.
+    `Component` renderer that converts a component tree into (nested) lists of resolved (`str`) parts.
     """
 
-    __slots__ = ("_async_todos", "_error_boundary_todos", "_sync_todos", "_root", "_string_formatter")
+    __slots__ = (
+        "_async_todos",
+        "_error_boundary_todos",
+        "_async_limiter",
+        "_sync_todos",
+        "_root",
+        "_string_formatter",
+    )
 
     def __init__(
         self,
-        component: ComponentType,
+        component: Component,
         context: Context,
         *,
         string_formatter: Callable[[str], str],
+        async_limiter: asyncio.Semaphore | None,
     ) -> None:
         """
         Initialization.
@@ -63,25 +124,25 @@ class _ComponentRenderer:
             component: The component to render.
             context: The base context to use for rendering the component.
             string_formatter: The string formatter to use.
+            async_limiter: Semaphore that limits the number of concurrently rendered async
+                components, `None` means no limit. It is shared by all the component renderers
+                of a render, so the limit applies to the whole render.
         """
-        self._async_todos: deque[_NodeAndChildContext] = deque()
-        """Async node - context tuples that need to be rendered."""
-        self._error_boundary_todos: deque[_NodeAndChildContext] = deque()
-        """Node context tuples where `node.component` is an `ErrorBoundary`."""
-        self._sync_todos: deque[_NodeAndChildContext] = deque()
-        """
-        Sync node - context tuples that need to be rendered (`node.component` is an `HTMYComponentType`).
-        """
+        self._async_todos: list[_Todo] = []
+        """Async component todos that need to be rendered."""
+        self._error_boundary_todos: list[_Todo] = []
+        """Todos whose component is an `ErrorBoundary`."""
+        self._sync_todos: list[_Todo] = []
+        """Sync component todos that need to be rendered."""
         self._string_formatter = string_formatter
         """The string formatter to use."""
+        self._async_limiter = async_limiter
+        """Semaphore that limits the number of concurrently rendered async components if needed."""
 
-        if isinstance(component, str):
-            root = _Node(string_formatter(component), None)
-        else:
-            root = _Node(component, None)
-            self._schedule_node(root, context)
+        root: _Parts = [None]
+        self._process_component_result(root, 0, component, context)
         self._root = root
-        """The root node in the linked list the renderer constructs."""
+        """The root parts list the renderer constructs."""
 
     async def _extend_context(self, component: ContextProvider, context: Context) -> Context:
         """
@@ -91,132 +152,187 @@ class _ComponentRenderer:
             component: A `ContextProvider` component.
             context: The current rendering context.
         """
-        extra_context: Context | Awaitable[Context] = component.htmy_context()
-        if isinstance(extra_context, Awaitable):
-            extra_context = await extra_context
-
-        return (
-            # Context must not be mutated. We can ignore that ChainMap expects mutable mappings.
-            ChainMap(extra_context, context)  # type: ignore[arg-type]
-            if extra_context
-            else context
-        )
+        if _is_async_context_provider(component):
+            extra_context: Context = await component.htmy_context()  # type: ignore[misc]
+        else:
+            extra_context = component.htmy_context()  # type: ignore[assignment]
 
-    async def _process_error_boundary(self, node: _Node, context: Context) -> None:
+        return _merge_contexts(context, extra_context) if extra_context else context
+
+    async def _process_error_boundary(
+        self, component: ErrorBoundary, parts: _Parts, index: int, context: Context
+    ) -> None:
         """
-        Processes a single node whose component is an `ErrorBoundary`.
+        Processes a single `ErrorBoundary` component.
         """
-        component: ErrorBoundary = node.component  # type: ignore[assignment]
         if hasattr(component, "htmy_context"):  # isinstance() is too expensive.
             context = await self._extend_context(component, context)
 
         try:
-            result = await _render_component(
+            result = await _ComponentRenderer(
                 component.htmy(context),
-                context=context,
+                context,
                 string_formatter=self._string_formatter,
-            )
+                async_limiter=self._async_limiter,
+            ).run()
         except Exception as e:
             renderer = _ComponentRenderer(
                 component.fallback_component(e),
                 context,
                 string_formatter=self._string_formatter,
+                async_limiter=self._async_limiter,
             )
             result = await renderer.run()
 
-        node.component = result  # No string formatting.
+        parts[index] = result  # No string formatting.
 
-    def _process_node_result(self, parent_node: _Node, component: Component, context: Context) -> None:
+    def _process_component_result(
+        self, parts: _Parts, index: int, component: Component, context: Context
+    ) -> None:
         """
-        Processes the result of a single node.
+        Processes the result of a single component.
 
         Arguments:
-            parent_node: The node that was resolved.
-            component: The (awaited if async) result of `parent_node.component.htmy()`.
-            context: The context that was used for rendering `parent_node.component`.
+            parts: The parts list that contains the resolved component.
+            index: The index of the resolved component in `parts`.
+            component: The (awaited if async) result of the resolved component's `htmy()` method.
+            context: The context that was used for rendering the resolved component.
         """
-        schedule_node = self._schedule_node
-        string_formatter = self._string_formatter
         if is_component_sequence(component):
-            if len(component) == 0:
-                parent_node.component = ""
-                return
-
-            first_comp, *rest_comps = component
-            if isinstance(first_comp, str):
-                parent_node.component = string_formatter(first_comp)
-            else:
-                parent_node.component = first_comp
-                schedule_node(parent_node, context)
-
-            old_next = parent_node.next
-            last: _Node = parent_node
-            for c in rest_comps:
+            schedule_component = self._schedule_component
+            string_formatter = self._string_formatter
+            children: _Parts = list(component)
+            resolved = True
+            for i, c in enumerate(children):
                 if isinstance(c, str):
-                    node = _Node(string_formatter(c), old_next)
+                    children[i] = string_formatter(c)
                 else:
-                    node = _Node(c, old_next)
-                    schedule_node(node, context)
+                    schedule_component(c, children, i, context)
+                    resolved = False
 
-                last.next = node
-                last = node
+            # Collapse fully resolved (string-only) results to avoid the nested list.
+            parts[index] = "".join(children) if resolved else children
         elif isinstance(component, str):
-            parent_node.component = string_formatter(component)
+            parts[index] = self._string_formatter(component)
         else:
-            parent_node.component = component  # type: ignore[assignment]
-            schedule_node(parent_node, context)
+            parts[index] = component
+            self._schedule_component(component, parts, index, context)  # type: ignore[arg-type]
 
-    async def _process_async_node(self, node: _Node, context: Context) -> None:
+    async def _process_async_component(
+        self, component: HTMYComponentType, parts: _Parts, index: int, context: Context
+    ) -> None:
         """
-        Processes the given node. `node.component` must be an async component.
+        Processes the given async component.
         """
-        result = await node.component.htmy(context)  # type: ignore[misc,union-attr]
-        self._process_node_result(node, result, context)
+        if hasattr(component, "htmy_context"):  # isinstance() is too expensive.
+            context = await self._extend_context(component, context)  # type: ignore[arg-type]
 
-    def _schedule_node(self, node: _Node, child_context: Context) -> None:
+        if self._async_limiter is None:
+            result = await component.htmy(context)  # type: ignore[misc]
+        else:
+            async with self._async_limiter:
+                result = await component.htmy(context)  # type: ignore[misc]
+
+        self._process_component_result(parts, index, result, context)
+
+    def _schedule_component(
+        self, component: HTMYComponentType, parts: _Parts, index: int, child_context: Context
+    ) -> None:
         """
-        Schedules the given node for rendering with the given child context.
+        Schedules the given component for rendering with the given child context.
 
-        `node.component` must be an `HTMYComponentType` (single component and not `str`).
+        Arguments:
+            component: The component to render. It must be in `parts` at `index`.
+            parts: The parts list that contains the component.
+            index: The index of the component in `parts`.
+            child_context: The context to render the component with.
         """
-        component = node.component
-        if asyncio.iscoroutinefunction(component.htmy):  # type: ignore[union-attr]
-            self._async_todos.append((node, child_context))
+        if _is_async_component(component):
+            self._async_todos.append((component, parts, index, child_context))
         elif isinstance(component, ErrorBoundary):
-            self._error_boundary_todos.append((node, child_context))
+            self._error_boundary_todos.append((component, parts, index, child_context))
         else:
-            self._sync_todos.append((node, child_context))
+            self._sync_todos.append((component, parts, index, child_context))
 
     async def run(self) -> str:
         """Runs the component renderer."""
         async_todos = self._async_todos
         sync_todos = self._sync_todos
-        process_node_result = self._process_node_result
-        process_async_node = self._process_async_node
+        process_component_result = self._process_component_result
+        process_async_component = self._process_async_component
 
         while sync_todos or async_todos:
-            while sync_todos:
-                node, child_context = sync_todos.pop()
-                component = node.component
-                if hasattr(component, "htmy_context"):  # isinstance() is too expensive.
-                    child_context = await self._extend_context(component, child_context)  # type: ignore[arg-type]
-
-                if asyncio.iscoroutinefunction(node.component.htmy):  # type: ignore[union-attr]
-                    async_todos.append((node, child_context))
-                else:
-                    result: Component = node.component.htmy(child_context)  # type: ignore[assignment,union-attr]
-                    process_node_result(node, result, child_context)
-
-            if async_todos:
-                await asyncio.gather(*(process_async_node(n, ctx) for n, ctx in async_todos))
-                async_todos.clear()
+            async_tasks: list[asyncio.Task[None]] = []
+            try:
+                while async_todos:
+                    # Processing async components may schedule new async components,
+                    # so the current todos must be taken out before processing.
+                    async_tasks.extend(
+                        asyncio.create_task(process_async_component(*todo)) for todo in async_todos
+                    )
+                    async_todos.clear()
+                    # Let the async components start (and wait for I/O for example)
+                    # while the pending sync components are being processed.
+                    await asyncio.sleep(0)
+
+                while sync_todos:
+                    # Drain the current todos in one block. Processing them schedules new todos,
+                    # which will be handled in the next iteration.
+                    current_sync_todos = list(sync_todos)
+                    sync_todos.clear()
+                    for component, parts, index, child_context in current_sync_todos:
+                        if hasattr(component, "htmy_context"):  # isinstance() is too expensive.
+                            child_context = await self._extend_context(component, child_context)  # type: ignore[arg-type]
+
+                        result: Component = component.htmy(child_context)  # type: ignore[assignment]
+                        process_component_result(parts, index, result, child_context)
+
+                if async_tasks:
+                    await asyncio.gather(*async_tasks)
+            finally:
+                # Don't leave tasks running if processing failed or the render was cancelled.
+                _cancel_pending(async_tasks)
 
         if self._error_boundary_todos:
-            await asyncio.gather(
-                *(self._process_error_boundary(n, ctx) for n, ctx in self._error_boundary_todos)
-            )
+            error_boundary_tasks = [
+                asyncio.create_task(self._process_error_boundary(c, parts, index, ctx))  # type: ignore[arg-type]
+                for c, parts, index, ctx in self._error_boundary_todos
+            ]
+            try:
+                await asyncio.gather(*error_boundary_tasks)
+            finally:
+                _cancel_pending(error_boundary_tasks)
+
+        return _join_parts(self._root)
 
-        return "".join(node.component for node in self._root.iter_nodes())  # type: ignore[misc]
+
+def _cancel_pending(tasks: list[asyncio.Task[None]]) -> None:
+    """Cancels the tasks from the given list that are not done yet."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+
+
+def _join_parts(parts: _Parts) -> str:
+    """
+    Joins the given, fully resolved (nested) parts list into a single string.
+
+    The implementation is iterative to avoid recursion limits with deeply nested parts.
+    """
+    result: list[str] = []
+    append = result.append
+    stack = [iter(parts)]
+    while stack:
+        for part in stack[-1]:
+            if type(part) is list:
+                stack.append(iter(part))
+                break
+
+            append(part)
+        else:
+            stack.pop()
+
+    return "".join(result)
 
 
 async def _render_component(
@@ -224,33 +340,33 @@ async def _render_component(
     *,
     context: Context,
     string_formatter: Callable[[str], str],
+    max_concurrency: int | None,
 ) -> str:
     """Renders the given component with the given settings."""
-    if is_component_sequence(component):
-        if len(component) == 0:
-            return ""
-
-        renderers = (_ComponentRenderer(c, context, string_formatter=string_formatter) for c in component)
-        return "".join(await asyncio.gather(*(r.run() for r in renderers)))
-    else:
-        return await _ComponentRenderer(component, context, string_formatter=string_formatter).run()  # type: ignore[arg-type]
+    return await _ComponentRenderer(
+        component,
+        context,
+        string_formatter=string_formatter,
+        async_limiter=None if max_concurrency is None else asyncio.Semaphore(max_concurrency),
+    ).run()
 
 
 class Renderer:
     """
     The default renderer.
 
-    It resolves component trees by converting them to a linked list of resolved component parts
+    It resolves component trees by converting them to (nested) lists of resolved component parts
     before combining them to the final string.
     """
 
-    __slots__ = ("_default_context", "_string_formatter")
+    __slots__ = ("_default_context", "_max_concurrency", "_string_formatter")
 
     def __init__(
         self,
         default_context: Context | None = None,
         *,
         string_formatter: Callable[[str], str] = xml_format_string,
+        max_concurrency: int | None = None,
     ) -> None:
         """
         Initialization.
@@ -260,9 +376,21 @@ class Renderer:
                 receive a context.
             string_formatter: Callable that should be used to format plain strings. By default
                 an XML-safe string formatter will be used.
+            max_concurrency: The maximum number of async components that are rendered concurrently
+                during a single render, including the content of error boundaries. Async components
+                beyond this limit wait until a previous one is done. Only concurrent `htmy()` calls
+                are limited, which is useful for example for bounding the load on external resources.
+                By default there is no limit.
+
+        Raises:
+            ValueError: If `max_concurrency` is not positive.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
+
         self._default_context: Context = {} if default_context is None else default_context
         self._string_formatter = string_formatter
+        self._max_concurrency = max_concurrency
 
     async def render(self, component: Component, context: Context | None = None) -> str:
         """
@@ -275,8 +403,12 @@ class Renderer:
         Returns:
             The rendered string.
         """
-        # Type ignore: ChainMap expects mutable mappings, but context mutation is not allowed so don't care.
         context = (
-            self._default_context if context is None else ChainMap(context, self._default_context)  # type: ignore[arg-type]
+            self._default_context if context is None else _merge_contexts(self._default_context, context)
+        )
+        return await _render_component(
+            component,
+            context=context,
+            string_formatter=self._string_formatter,
+            max_concurrency=self._max_concurrency,
         )
-        return await _render_component(component, context=context, string_formatter=self._string_formatter)
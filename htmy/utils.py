@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections.abc import Generator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,7 +10,7 @@ def join_components(
     components: ComponentSequence,
     separator: ComponentType,
     pad: bool = False,
-) -> Generator[ComponentType, None, None]:
+) -> list[ComponentType]:
     """
     Joins the given components using the given separator.
 
@@ -19,26 +18,27 @@ def join_components(
         components: The components to join.
         separator: The separator to use.
         pad: Whether to add a separator before the first and after the last components.
+
+    Returns:
+        The list of joined components.
     """
-    if len(components) == 0:
-        return
+    count = len(components)
+    if count == 0:
+        return []
 
+    # Fill a separator-only list and then replace every other item with the components.
     if pad:
-        yield separator
-
-    components_iterator = iter(components)
-    yield next(components_iterator)
+        result = [separator] * (2 * count + 1)
+        result[1::2] = components
+    else:
+        result = [separator] * (2 * count - 1)
+        result[::2] = components
 
-    for component in components_iterator:
-        yield separator
-        yield component
-
-    if pad:
-        yield separator
+    return result
 
 
 def join(*items: str | None, separator: str = " ") -> str:
     """
     Joins the given strings with the given separator, skipping `None` values.
     """
-    return separator.join(i for i in items if i)
+    return separator.join([i for i in items if i])
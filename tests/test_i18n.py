@@ -1,8 +1,13 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from htmy.i18n import I18n, I18nKeyError, I18nValueError
+import htmy.i18n as i18n_module
+from htmy.i18n import I18n, I18nKeyError, I18nValueError, load_translation_resource
 
 from .utils import tests_root
 
@@ -83,3 +88,81 @@ async def test_i18n_with_fallback(
 async def test_i18n_missing_resource(dotted_path: str, key: str, error: type[Exception]) -> None:
     with pytest.raises(error):
         await hu_no_fallback.get(dotted_path, key)
+
+
+@pytest.mark.asyncio
+async def test_i18n_preload(tmp_path: Path) -> None:
+    for locale, content in (("hu", '{"title": "Helló"}'), ("en", '{"title": "Hello", "message": "Hi."}')):
+        (tmp_path / locale / "page").mkdir(parents=True)
+        (tmp_path / locale / "page" / "welcome.json").write_text(content)
+
+    i18n = I18n(tmp_path / "hu", tmp_path / "en")
+    load_translation_resource.cache_clear()
+    await i18n.preload()
+
+    # Everything must be served from the cache once the files are gone.
+    for locale in ("hu", "en"):
+        (tmp_path / locale / "page" / "welcome.json").unlink()
+
+    assert await i18n.get("page.welcome", "title") == "Helló"
+    assert await i18n.get("page.welcome", "message") == "Hi."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fallback", ("same", "nested"))
+async def test_i18n_preload_loads_each_resource_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fallback: str
+) -> None:
+    (tmp_path / "en" / "page").mkdir(parents=True)
+    (tmp_path / "page.json").write_text('{"title": "Page"}')
+    (tmp_path / "en" / "page" / "welcome.json").write_text('{"title": "Welcome"}')
+
+    loaded: list[Path] = []
+
+    async def load(path: Path) -> dict[str, Any]:
+        loaded.append(path)
+        return {}
+
+    monkeypatch.setattr(i18n_module, "load_translation_resource", load)
+    await I18n(tmp_path, tmp_path if fallback == "same" else tmp_path / "en").preload()
+    assert sorted(loaded) == sorted((tmp_path / "page.json", tmp_path / "en" / "page" / "welcome.json"))
+
+
+@pytest.mark.asyncio
+async def test_i18n_preload_invalid_resource(tmp_path: Path) -> None:
+    (tmp_path / "valid.json").write_text('{"title": "Valid"}')
+    (tmp_path / "invalid.json").write_text('["not", "a", "dict"]')
+    with pytest.raises(I18nValueError):
+        await I18n(tmp_path).preload()
+
+
+@pytest.mark.asyncio
+async def test_i18n_cache_clear_reloads_resources(tmp_path: Path) -> None:
+    resource = tmp_path / "page.json"
+    resource.write_text('{"title": "Old"}')
+    i18n = I18n(tmp_path)
+    assert await i18n.get("page", "title") == "Old"
+
+    resource.write_text('{"title": "New"}')
+    assert await i18n.get("page", "title") == "Old"
+
+    load_translation_resource.cache_clear()
+    assert await i18n.get("page", "title") == "New"
+
+
+@pytest.mark.asyncio
+async def test_i18n_json_fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)  # Makes importing orjson fail.
+    # Load a separate copy of the module, reloading htmy.i18n would replace the classes other tests use.
+    spec = importlib.util.spec_from_file_location("htmy._i18n_json_fallback", i18n_module.__file__)
+    assert spec is not None and spec.loader is not None
+    fallback_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fallback_module)
+    assert fallback_module.json_loads is json.loads
+
+    (tmp_path / "valid.json").write_text('{"title": "Helló"}')
+    (tmp_path / "invalid.json").write_text('{"title": ')
+    i18n = fallback_module.I18n(tmp_path)
+    assert await i18n.get("valid", "title") == "Helló"
+    with pytest.raises(fallback_module.I18nValueError):
+        await i18n.get("invalid", "title")
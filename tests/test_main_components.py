@@ -7,6 +7,7 @@ import pytest
 
 from htmy import (
     Component,
+    ComponentType,
     Context,
     ErrorBoundary,
     Formatter,
@@ -103,7 +104,7 @@ class Page:
                 p_2="fls",
                 p_3=True,
             ),
-            context={**CustomTagFormatter().to_context(), "aio-sleep": 1},
+            context={**CustomTagFormatter().to_context(), "aio-sleep": 0.01},
         )
 
     @staticmethod
@@ -115,18 +116,18 @@ class Page:
                 '<tp x="x1" y="y1" checked="" required="" />',
                 "sync_fc-int:987321",
                 "async_fc-int:456",
-                "<a_main >",
+                "<a_main>",
                 '<div dp-1="123" class="w-full">',
                 "sd&lt;fs&gt; df",
                 '<h1 created-at="2024-10-03T04:42:02.000071+00:00" on_day="2024-10-03">sdfds</h1>',
                 "</div>",
-                "<h1 >Fallback after rendering error.</h1>",
+                "<h1>Fallback after rendering error.</h1>",
                 "</a_main>",
-                "<div ></div>",
-                "<a_h2 >something</a_h2>",
-                "<div >",
+                "<div></div>",
+                "<a_h2>something</a_h2>",
+                "<div>",
                 "something else",
-                "<div >",
+                "<div>",
                 "inner something else",
                 "</div>",
                 "</div>",
@@ -135,12 +136,17 @@ class Page:
         )
 
 
+_page = Page.page()
+_rendered_page = Page.rendered()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("page", "context", "expected"),
     (
-        (Page.page(), None, Page.rendered()),
-        (Page.page(), None, Page.rendered()),
+        # The same tree is rendered twice to make sure rendering doesn't change it.
+        (_page, None, _rendered_page),
+        (_page, None, _rendered_page),
     ),
 )
 async def test_complex_page_rendering(
@@ -150,8 +156,46 @@ async def test_complex_page_rendering(
     context: Context | None,
     expected: str,
 ) -> None:
-    result = await default_renderer.render(page, context)
-    assert result == expected
+    # Render the page concurrently with both renderers, which also makes sure that
+    # rendering the same tree concurrently is safe.
+    default_result, baseline_result = await asyncio.gather(
+        default_renderer.render(page, context),
+        baseline_renderer.render(page, context),
+    )
+    assert default_result == expected
+    assert baseline_result == expected
+
+
+class Nest:
+    def __init__(self, child: ComponentType) -> None:
+        self.child = child
+
+    def htmy(self, context: Context) -> Component:
+        return ("(", self.child, ")")
+
+
+@pytest.mark.asyncio
+async def test_deeply_nested_component_rendering(default_renderer: Renderer) -> None:
+    depth = 5000
+    page: ComponentType = "x"
+    for _ in range(depth):
+        page = Nest(page)
+
+    result = await default_renderer.render(page)
+    assert result == "(" * depth + "x" + ")" * depth
 
-    result = await baseline_renderer.render(page, context)
-    assert result == expected
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("w-full", '"w-full"'),
+        ("", '""'),
+        ("a & b < c > d", '"a &amp; b &lt; c &gt; d"'),
+        ("line\nbreak\r\ttab", '"line&#10;break&#13;&#9;tab"'),
+        ('say "hi"', "'say \"hi\"'"),
+        ("it's", '"it\'s"'),
+        ('it\'s "quoted"', '"it\'s &quot;quoted&quot;"'),
+    ),
+)
+def test_formatter_attribute_quoting(value: str, expected: str) -> None:
+    assert Formatter().format("data_value", value) == f"data-value={expected}"
@@ -3,6 +3,7 @@ from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from markdown import Markdown
 
 from htmy import (
     Component,
@@ -96,33 +97,33 @@ class ConverterRules:
         }
 
 
-_base_etree_converted_blogpost = """<h1 {h1_attrs}>Essential reading</h1>
-<div class="codehilite"><pre ><span ></span><code ><span class="kn">import</span> <span class="nn">this</span>
+_base_etree_converted_blogpost = """<h1{h1_attrs}>Essential reading</h1>
+<div class="codehilite"><pre><span></span><code><span class="kn">import</span> <span class="nn">this</span>
 </code></pre></div>
 
-<p >Also available <a href="https://peps.python.org/pep-0020/">here</a>.</p>
-<p >Inline <code >code</code> is <strong >also</strong> <em >fine</em>.</p>
-<h1 {h1_attrs}>Lists</h1>
-<h2 >Ordered</h2>
-<ol {ol_attrs}>{extra_separator}
-<li >First</li>{extra_separator}
-<li >Second</li>{extra_separator}
-<li >Third</li>{extra_separator}
+<p>Also available <a href="https://peps.python.org/pep-0020/">here</a>.</p>
+<p>Inline <code>code</code> is <strong>also</strong> <em>fine</em>.</p>
+<h1{h1_attrs}>Lists</h1>
+<h2>Ordered</h2>
+<ol{ol_attrs}>{extra_separator}
+<li>First</li>{extra_separator}
+<li>Second</li>{extra_separator}
+<li>Third</li>{extra_separator}
 </ol>
-<h2 >Unordered</h2>
-<ul {ul_attrs}>{extra_separator}
-<li >First</li>{extra_separator}
-<li >Second</li>{extra_separator}
-<li >Third</li>{extra_separator}
+<h2>Unordered</h2>
+<ul{ul_attrs}>{extra_separator}
+<li>First</li>{extra_separator}
+<li>Second</li>{extra_separator}
+<li>Third</li>{extra_separator}
 </ul>"""
 
 _etree_converted_blogpost = _base_etree_converted_blogpost.format(
     h1_attrs="", ol_attrs="", ul_attrs="", extra_separator=""
 )
 _etree_converted_blogpost_with_extra_classes = _base_etree_converted_blogpost.format(
-    h1_attrs=f'class="{ConverterRules.h1_classes} "',
-    ol_attrs=f'class="{ConverterRules.ol_classes} "',
-    ul_attrs=f'class="{ConverterRules.ul_classes} "',
+    h1_attrs=f' class="{ConverterRules.h1_classes} "',
+    ol_attrs=f' class="{ConverterRules.ol_classes} "',
+    ul_attrs=f' class="{ConverterRules.ul_classes} "',
     extra_separator="\n\n",
 )
 
@@ -153,14 +154,18 @@ def _md_renderer(children: Component, metadata: md.MarkdownMetadataDict | None)
     ),
 )
 async def test_parsing(
-    path_or_text: Text | str | Path, text_processor: TextProcessor, expected: str
+    path_or_text: Text | str | Path,
+    text_processor: TextProcessor,
+    expected: str,
+    default_renderer: Renderer,
+    baseline_renderer: BaselineRenderer,
 ) -> None:
     md_component = md.MD(path_or_text, text_processor=text_processor)
-    rendered = await Renderer().render(md_component)
+    rendered = await default_renderer.render(md_component)
     assert isinstance(rendered, str)
     assert rendered == expected
 
-    rendered = await BaselineRenderer().render(md_component)
+    rendered = await baseline_renderer.render(md_component)
     assert isinstance(rendered, str)
     assert rendered == expected
 
@@ -216,34 +221,68 @@ async def test_parsing_and_conversion(
     components: dict[str, Callable[..., ComponentType]],
     text_processor: TextProcessor,
     expected: str,
+    default_renderer: Renderer,
+    baseline_renderer: BaselineRenderer,
 ) -> None:
     converter = etree.ETreeConverter(components)
     md_component = md.MD(path_or_text, converter=converter.convert, text_processor=text_processor)
-    rendered = await Renderer().render(md_component)
+    rendered = await default_renderer.render(md_component)
     assert rendered == expected
 
-    rendered = await BaselineRenderer().render(md_component)
+    rendered = await baseline_renderer.render(md_component)
     assert rendered == expected
 
     md_component_with_renderer = md.MD(
         path_or_text, converter=converter.convert, renderer=_md_renderer, text_processor=text_processor
     )
-    rendered = await Renderer().render(md_component_with_renderer)
-    assert rendered == "\n".join(
-        (
-            "<div >",
-            "<h1 >Markdown</h1>",
-            expected,
-            "</div>",
-        )
-    )
+    expected_with_renderer = f"<div>\n<h1>Markdown</h1>\n{expected}\n</div>"
+    rendered = await default_renderer.render(md_component_with_renderer)
+    assert rendered == expected_with_renderer
 
-    rendered = await BaselineRenderer().render(md_component_with_renderer)
-    assert rendered == "\n".join(
-        (
-            "<div >",
-            "<h1 >Markdown</h1>",
-            expected,
-            "</div>",
-        )
-    )
+    rendered = await baseline_renderer.render(md_component_with_renderer)
+    assert rendered == expected_with_renderer
+
+
+def test_default_parser_caches_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    convert_calls = 0
+    convert = Markdown.convert
+
+    def counting_convert(self: Markdown, source: str) -> str:
+        nonlocal convert_calls
+        convert_calls += 1
+        return convert(self, source)
+
+    monkeypatch.setattr(Markdown, "convert", counting_convert)
+    parser = md.MarkdownParser()
+    parsed = parser.parse(_blog_post)
+    assert parsed["content"] == _parsed_blog_post
+    assert parser.parse(_blog_post) == parsed
+    assert convert_calls == 1
+
+
+def test_default_parser_results_can_be_mutated() -> None:
+    parser = md.MarkdownParser()
+    parsed = parser.parse(_blog_post)
+    assert parsed["metadata"] is not None
+    parsed["metadata"]["title"].append("Mutated")
+    parsed["metadata"].pop("title")
+    parsed["content"] = ""
+
+    reparsed = parser.parse(_blog_post)
+    assert reparsed["content"] == _parsed_blog_post
+    assert reparsed["metadata"] == {"title": ["Markdown"]}
+
+
+@pytest.mark.asyncio
+async def test_renderer_metadata_mutation_does_not_affect_later_renders(
+    default_renderer: Renderer, baseline_renderer: BaselineRenderer
+) -> None:
+    def popping_renderer(children: Component, metadata: md.MarkdownMetadataDict | None) -> Component:
+        assert metadata is not None
+        title = metadata.pop("title", None)
+        return title[0] if title else "<no title>"
+
+    text = Text("---\ntitle: Hello\n---\n\nContent.")
+    for _ in range(2):
+        assert await default_renderer.render(md.MD(text, renderer=popping_renderer)) == "Hello"
+        assert await baseline_renderer.render(md.MD(text, renderer=popping_renderer)) == "Hello"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import pytest
@@ -8,6 +9,8 @@ from htmy import ErrorBoundary, Fragment, Renderer, component, html
 from htmy.renderer import BaselineRenderer
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from htmy import Component, ComponentType, Context
 
 # -- Sync and async page.
@@ -82,8 +85,39 @@ class Nested:
         )
 
 
+class Provider:
+    def __init__(self, key: str, value: int, child: ComponentType) -> None:
+        self.key = key
+        self.value = value
+        self.child = child
+
+    def htmy_context(self) -> Context:
+        return {self.key: self.value}
+
+    def htmy(self, context: Context) -> Component:
+        return (self.child, " ", ",".join(f"{k}={v}" for k, v in sorted(context.items())))
+
+
+class AsyncProvider(Provider):
+    async def htmy_context(self) -> Context:  # type: ignore[override]
+        return {self.key: self.value}
+
+
+class AsyncRenderedProvider(Provider):
+    async def htmy(self, context: Context) -> Component:  # type: ignore[override]
+        return super().htmy(context)
+
+
+def nested_providers(depth: int, key_count: int) -> ComponentType:
+    provider_types = (AsyncProvider, Provider, AsyncRenderedProvider)
+    result: ComponentType = "leaf"
+    for i in range(depth):
+        result = provider_types[i % 3](f"k{i % key_count}", i, result)
+    return result
+
+
 def sync_async_divs(i: int) -> Fragment:
-    return Fragment(html.div(f"Sync {i}", " ", "end"), WrapAsync(html.div("Async {i}", " ", "end")))
+    return Fragment(html.div(f"Sync {i}", " ", "end"), WrapAsync(html.div(f"Async {i}", " ", "end")))
 
 
 # -- Sync and async error components.
@@ -99,6 +133,9 @@ class AsyncError:
         raise ValueError("async-error-component")
 
 
+_nested_divs = [Nested(sync_async_divs(i)) for i in range(100)]
+
+
 # -- Tests
 
 
@@ -107,9 +144,15 @@ class AsyncError:
     ("component",),
     (
         # -- Render a component sequence directly.
-        ([Nested(sync_async_divs(i)) for i in range(100)],),
+        (_nested_divs,),
         # -- Render a larger, nested component tree.
-        (page(Fragment(*[Nested(sync_async_divs(i)) for i in range(100)])),),
+        (page(Fragment(*_nested_divs)),),
+        # -- Nested context providers, with small and large contexts.
+        (nested_providers(20, 5),),
+        (nested_providers(100, 50),),
+        (html.div(nested_providers(10, 5), nested_providers(10, 3)),),
+        # -- Async components that return async components.
+        (("x", WrapAsync(WrapAsync("deep")), WrapAsync(WrapAsync("a"), WrapAsync(WrapAsync("b")))),),
         # -- Error boundary
         (Nested(ErrorBoundary(Nested(SyncError()), fallback="Fallback to sync error.")),),
         (Nested(ErrorBoundary(Nested(AsyncError()), fallback="Fallback to async error.")),),
@@ -124,3 +167,96 @@ async def test_renderers(
     default_renderer_result = await default_renderer.render(component)
     baseline_renderer_result = await baseline_renderer.render(component)
     assert default_renderer_result == baseline_renderer_result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", (1, 3, 1000))
+async def test_default_renderer_max_concurrency(
+    *,
+    max_concurrency: int,
+    baseline_renderer: BaselineRenderer,
+) -> None:
+    component = page(Fragment(*[Nested(sync_async_divs(i)) for i in range(20)]))
+    result = await Renderer(max_concurrency=max_concurrency).render(component)
+    assert result == await baseline_renderer.render(component)
+
+
+def test_default_renderer_invalid_max_concurrency() -> None:
+    with pytest.raises(ValueError):
+        Renderer(max_concurrency=0)
+
+
+class ConcurrencyCounter:
+    def __init__(self) -> None:
+        self.current = 0
+        self.max = 0
+
+
+class Sleeper:
+    def __init__(self, counter: ConcurrencyCounter) -> None:
+        self.counter = counter
+
+    async def htmy(self, context: Context) -> Component:
+        counter = self.counter
+        counter.current += 1
+        counter.max = max(counter.max, counter.current)
+        await asyncio.sleep(0.001)
+        counter.current -= 1
+        return "z"
+
+
+def sleepers(counter: ConcurrencyCounter) -> ComponentType:
+    return html.div(
+        *(Sleeper(counter) for _ in range(10)), WrapAsync(*(Sleeper(counter) for _ in range(10)))
+    )
+
+
+def error_boundary_sleepers(counter: ConcurrencyCounter) -> ComponentType:
+    return html.div(
+        *(ErrorBoundary(*(Sleeper(counter) for _ in range(5)), fallback="Fallback.") for _ in range(4))
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", (1, 3, None))
+@pytest.mark.parametrize("component_factory", (sleepers, error_boundary_sleepers))
+async def test_default_renderer_max_concurrency_is_respected(
+    max_concurrency: int | None, component_factory: Callable[[ConcurrencyCounter], ComponentType]
+) -> None:
+    counter = ConcurrencyCounter()
+    result = await Renderer(max_concurrency=max_concurrency).render(component_factory(counter))
+    assert result.count("z") == 20
+    assert counter.max == (20 if max_concurrency is None else max_concurrency)
+
+
+class SlowAsync:
+    def __init__(self) -> None:
+        self.finished = False
+
+    async def htmy(self, context: Context) -> Component:
+        await asyncio.sleep(0.05)
+        self.finished = True
+        return "slow"
+
+
+@pytest.mark.asyncio
+async def test_default_renderer_cancellation_cancels_async_components() -> None:
+    slow = SlowAsync()
+    render_task = asyncio.create_task(Renderer().render(html.div(slow, WrapAsync("a"))))
+    await asyncio.sleep(0)  # Let the renderer start the async components.
+    render_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await render_task
+
+    await asyncio.sleep(0.1)
+    assert not slow.finished
+
+
+@pytest.mark.asyncio
+async def test_default_renderer_async_error_cancels_async_siblings() -> None:
+    slow = SlowAsync()
+    with pytest.raises(ValueError, match="async-error-component"):
+        await Renderer().render(html.div(slow, AsyncError()))
+
+    await asyncio.sleep(0.1)
+    assert not slow.finished
@@ -53,9 +53,12 @@ async def async_text_processor(text: str, context: Context) -> str:
     ),
 )
 async def test_snippet(
-    path_or_text: Text | str | Path, text_processor: TextProcessor, expected: str
+    path_or_text: Text | str | Path,
+    text_processor: TextProcessor,
+    expected: str,
+    default_renderer: Renderer,
 ) -> None:
     snippet = Snippet(path_or_text, text_processor=text_processor)
-    rendered = await Renderer().render(snippet)
+    rendered = await default_renderer.render(snippet)
     assert isinstance(rendered, str)
     assert rendered == expected
@@ -0,0 +1,32 @@
+import pytest
+
+from htmy import ComponentSequence, join_components
+from htmy.utils import join
+
+
+@pytest.mark.parametrize(
+    ("components", "pad", "expected"),
+    (
+        ((), False, []),
+        ((), True, []),
+        (("a",), False, ["a"]),
+        (("a",), True, ["|", "a", "|"]),
+        (["a", "b", "c"], False, ["a", "|", "b", "|", "c"]),
+        (["a", "b", "c"], True, ["|", "a", "|", "b", "|", "c", "|"]),
+    ),
+)
+def test_join_components(components: ComponentSequence, pad: bool, expected: list[str]) -> None:
+    assert join_components(components, "|", pad=pad) == expected
+
+
+@pytest.mark.parametrize(
+    ("items", "separator", "expected"),
+    (
+        ((), " ", ""),
+        ((None, ""), " ", ""),
+        (("a", None, "b", "", "c"), " ", "a b c"),
+        (("a", "b"), ", ", "a, b"),
+    ),
+)
+def test_join(items: tuple[str | None, ...], separator: str, expected: str) -> None:
+    assert join(*items, separator=separator) == expected